@@ -261,6 +261,9 @@ class FileSystemClient:
     def find_one(self, dbname, collname, filter):
         """Finds the first document matching filter."""
         coll = self.dbs[dbname][collname]
+        if filter.keys() == {"_id"}:
+            # collections are keyed by _id, so skip the scan
+            return coll.get(filter["_id"])
         for doc in coll.values():
             matches = True
             for key, value in filter.items():
@@ -4,14 +4,13 @@ Helper to add expenses.
 import datetime as dt
 import dateutil.parser as date_parser
 
-from regolith.helpers.basehelper import DbHelperBase
+from regolith.helpers.basehelper import DbHelperBase, _is_gooey
 from regolith.fsclient import _id_key
 from regolith.schemas import EXPENSES_STATI, EXPENSES_TYPES
 from regolith.tools import (
     all_docs_from_collection,
     get_pi_id,
 )
-from gooey import GooeyParser
 
 TARGET_COLL = "expenses" 
 
@@ -151,7 +150,7 @@ def expense_constructor(key, begin_date, end_date, rc):
 
 def subparser(subpi):
     amount_gooey_kwargs, notes_gooey_kwargs, date_gooey_kwargs = {}, {}, {}
-    if isinstance(subpi, GooeyParser):
+    if _is_gooey(subpi):
         amount_gooey_kwargs['widget'] = 'DecimalField'
         amount_gooey_kwargs['gooey_options'] = {'min': 0.00, 'max': 1000000.00, 'increment': 10.00, 'precision' : 2}
         notes_gooey_kwargs['widget'] = 'Textarea'
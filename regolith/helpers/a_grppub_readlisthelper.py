@@ -2,12 +2,11 @@
 import datetime as dt
 import dateutil.parser as date_parser
 
-from regolith.helpers.basehelper import DbHelperBase
+from regolith.helpers.basehelper import DbHelperBase, _is_gooey
 from regolith.fsclient import _id_key
 from regolith.tools import (
     all_docs_from_collection, get_tags
 )
-from gooey import GooeyParser
 
 ALLOWED_TYPES = ["nsf", "doe", "other"]
 ALLOWED_STATI = ["invited", "accepted", "declined", "downloaded", "inprogress",
@@ -16,7 +15,7 @@ ALLOWED_STATI = ["invited", "accepted", "declined", "downloaded", "inprogress",
 
 def subparser(subpi):
     date_kwargs = {}
-    if isinstance(subpi, GooeyParser):
+    if _is_gooey(subpi):
         date_kwargs['widget'] = 'DateChooser'
 
     subpi.add_argument("list_name", help="A short but unique name for the list. "
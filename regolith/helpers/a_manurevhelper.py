@@ -4,13 +4,12 @@ from dateutil import parser as dateparser
 
 import nameparser
 
-from regolith.helpers.basehelper import DbHelperBase
+from regolith.helpers.basehelper import DbHelperBase, _is_gooey
 from regolith.dates import month_to_str_int
 from regolith.fsclient import _id_key
 from regolith.tools import (
     all_docs_from_collection,
 )
-from gooey import GooeyParser
 
 ALLOWED_STATI = ["invited", "accepted", "declined", "downloaded", "inprogress",
                  "submitted", "cancelled"]
@@ -18,7 +17,7 @@ ALLOWED_STATI = ["invited", "accepted", "declined", "downloaded", "inprogress",
 
 def subparser(subpi):
     date_kwargs = {}
-    if isinstance(subpi, GooeyParser):
+    if _is_gooey(subpi):
         date_kwargs['widget'] = 'DateChooser'
 
     subpi.add_argument("name", help="Full name, or last name, of the first author",
@@ -1,103 +1,132 @@
 """Helper for adding a presentation to the presentation collection.
 """
-import time
+from datetime import datetime
 
 import dateutil.parser as date_parser
-import threading
 
 from regolith.helpers.a_expensehelper import expense_constructor
-from regolith.helpers.basehelper import DbHelperBase
-from regolith.fsclient import _id_key
+from regolith.helpers.basehelper import DbHelperBase, _is_gooey
 from regolith.schemas import PRESENTATION_TYPES, PRESENTATION_STATI
 from regolith.tools import (
     all_docs_from_collection,
     get_pi_id,
     add_to_google_calendar,
+    get_google_calendar_service,
     google_cal_auth_flow
 )
-from gooey import GooeyParser
 
 TARGET_COLL = "presentations"
 EXPENSES_COLL = "expenses"
+_STATUS_HELP = f"status, from {PRESENTATION_STATI}, default is accepted"
+_TYPE_HELP = f"types, from {PRESENTATION_TYPES}. Default is invited"
+
+
+def _parse_date(datestr):
+    """Parses an ISO date string, falling back to dateutil for other formats"""
+    try:
+        return datetime.strptime(datestr, "%Y-%m-%d").date()
+    except ValueError:
+        return date_parser.parse(datestr).date()
+
+
+def _name_key(person):
+    """Initials of the first and last words of a person, or the first two
+    characters of a one word id, for use in the presentation id"""
+    words = person.split(None, 1)
+    if len(words) == 2:
+        return (words[0][0] + person.rsplit(None, 1)[-1][0]).casefold()
+    return words[0][:2].casefold()
+
+
+def _add_event_to_calendar(event):
+    """Adds an event to google calendar, running the auth flow if needed"""
+    service = get_google_calendar_service()
+    if service is None:
+        # the auth flow blocks until the token file is written, so a
+        # single retry is enough
+        google_cal_auth_flow()
+        service = get_google_calendar_service()
+        if service is None:
+            raise RuntimeError("Failed to add event to Google Calendar")
+    add_to_google_calendar(event, service=service)
+
+
+# (flags, add_argument kwargs) for subparser, in the order they are added
+_ARG_SPEC = [
+    (("name",),
+     {"help": "name of the event of the presentation. Meeting name if meeting, "
+              "department if seminar"}),
+    (("place",),
+     {"help": "the place of the presentation, Location if conference, "
+              "institution for seminars"}),
+    (("begin_date",),
+     {"help": "Input begin date for this presentation "}),
+    (("end_date",),
+     {"help": "Input end date for this presentation"}),
+    (("-t", "--title"),
+     {"help": "the title of the presentation, default is tbd",
+      "default": 'tbd'}),
+    (("-a", "--abstract"),
+     {"help": "abstract of the presentation, defaults to tbd",
+      "default": 'tbd'}),
+    (("-p", "--person"),
+     {"help": "the person presenting the presentation, used for presentation name,"
+              " defaults to name in user.config"}),
+    (("--authors",),
+     {"nargs": "+",
+      "help": "specify the authors of this presentation, "
+              "defaults to person submitting the presentation"}),
+    (("-g", "--grants"),
+     {"nargs": "+",
+      "help": "grant, or grants (separated by spaces), that support this presentation. Defaults to tbd",
+      "default": "tbd"}),
+    (("-u", "--presentation-url"),
+     {"help": "the url to the presentation, whether it is on Google Drive, GitHub or wherever"}),
+    (("-n", "--notes"),
+     {"nargs": "+",
+      "help": "note or notes to be inserted as a list into the notes field, "
+              "separate notes with spaces.  Place inside quotes if the note "
+              "itself contains spaces."}),
+    (("-s", "--status"),
+     {"choices": PRESENTATION_STATI,
+      "help": _STATUS_HELP,
+      "default": "accepted"}),
+    (("-y", "--type"),
+     {"choices": PRESENTATION_TYPES,
+      "help": _TYPE_HELP,
+      "default": "invited"}),
+    (("-w", "--webinar"),
+     {"help": "Is the presentation a webinar?",
+      "action": "store_true"}),
+    (("--no-expense",),
+     {"help": "Do not add a template expense item to the "
+              "expenses collection.  Default is to add "
+              "an expense if the presentation is not a "
+              "webinar.",
+      "action": "store_true"}),
+    (("--database",),
+     {"help": "The database that will be updated.  Defaults to "
+              "first database in the regolithrc.json file."}),
+    (("--id",),
+     {"help": "Override the default id created from the date, "
+              "speaker and place by specifying an id here"}),
+    (("--no_cal",),
+     {"help": "Do not add the presentation to google calendar",
+      "action": "store_true"}),
+]
+_DATE_ARGS = {"begin_date", "end_date"}
 
 
 def subparser(subpi):
     date_kwargs = {}
-    if isinstance(subpi, GooeyParser):
+    if _is_gooey(subpi):
         date_kwargs['widget'] = 'DateChooser'
 
-    subpi.add_argument("name", help="name of the event of the presentation. Meeting name if meeting, "
-                                    "department if seminar",
-                       )
-    subpi.add_argument("place", help="the place of the presentation, Location if conference, "
-                                     "institution for seminars"
-                       )
-    subpi.add_argument("begin_date",
-                       help="Input begin date for this presentation ",
-                       **date_kwargs
-                       )
-    subpi.add_argument("end_date",
-                       help="Input end date for this presentation",
-                       **date_kwargs
-                       )
-    subpi.add_argument("-t", "--title",
-                       help="the title of the presentation, default is tbd",
-                       default='tbd'
-                       )
-    subpi.add_argument("-a", "--abstract",
-                       help="abstract of the presentation, defaults to tbd",
-                       default='tbd'
-                       )
-    subpi.add_argument("-p", "--person",
-                       help="the person presenting the presentation, used for presentation name,"
-                            " defaults to name in user.config",
-                       )
-    subpi.add_argument("--authors", nargs="+",
-                       help="specify the authors of this presentation, "
-                            "defaults to person submitting the presentation",
-                       )
-    subpi.add_argument("-g", "--grants", nargs="+",
-                       help="grant, or grants (separated by spaces), that support this presentation. Defaults to tbd",
-                       default="tbd"
-                       )
-    subpi.add_argument("-u", "--presentation-url",
-                       help="the url to the presentation, whether it is on Google Drive, GitHub or wherever",
-                       )
-    subpi.add_argument("-n", "--notes", nargs="+",
-                       help="note or notes to be inserted as a list into the notes field, "
-                            "separate notes with spaces.  Place inside quotes if the note "
-                            "itself contains spaces."
-                       )
-    subpi.add_argument("-s", "--status",
-                       choices=PRESENTATION_STATI,
-                       help=f"status, from {PRESENTATION_STATI}, default is accepted",
-                       default="accepted"
-                       )
-    subpi.add_argument("-y", "--type", 
-                       choices=PRESENTATION_TYPES,
-                       help=f"types, from {PRESENTATION_TYPES}. Default is invited",
-                       default="invited"
-                       )
-    subpi.add_argument("-w", "--webinar", help=f"Is the presentation a webinar?",
-                       action="store_true"
-                       )
-    subpi.add_argument("--no-expense", help=f"Do not add a template expense item to the "
-                                            f"expenses collection.  Default is to add "
-                                            f"an expense if the presentation is not a "
-                                            f"webinar.",
-                       action="store_true"
-                       )
-    subpi.add_argument("--database",
-                       help="The database that will be updated.  Defaults to "
-                            "first database in the regolithrc.json file.",
-                       )
-    subpi.add_argument("--id",
-                       help="Override the default id created from the date, "
-                            "speaker and place by specifying an id here",
-                       )
-    subpi.add_argument("--no_cal",
-                       help=f"Do not add the presentation to google calendar",
-                       action="store_true")
+    for flags, kwargs in _ARG_SPEC:
+        if flags[0] in _DATE_ARGS:
+            subpi.add_argument(*flags, **kwargs, **date_kwargs)
+        else:
+            subpi.add_argument(*flags, **kwargs)
     return subpi
 
 
@@ -118,36 +147,16 @@ class PresentationAdderHelper(DbHelperBase):
         rc.coll = f"{TARGET_COLL}"
         if not rc.database:
             rc.database = rc.databases[0]["name"]
-        gtx[rc.coll] = sorted(
-            all_docs_from_collection(rc.client, rc.coll), key=_id_key
-        )
         gtx["all_docs_from_collection"] = all_docs_from_collection
         gtx["float"] = float
         gtx["str"] = str
         gtx["zip"] = zip
 
     def db_updater(self):
-        gtx = self.gtx
         rc = self.rc
-        if not rc.no_cal:
-            event = {
-                        'summary': rc.name,
-                        'location': rc.place,
-                        'start': {'date': rc.begin_date},
-                        'end': {'date': rc.end_date}
-                    }
-            cal_update_bool = add_to_google_calendar(event)
-            if not cal_update_bool:
-                google_cal_auth_flow()
-                wait_bool, jump = 0, 0
-                while not wait_bool or jump == 60:
-                    time.sleep(1)
-                    wait_bool = add_to_google_calendar(event)
-                    jump += 1
-
         # dates
-        begin_date = date_parser.parse(rc.begin_date).date()
-        end_date = date_parser.parse(rc.end_date).date()
+        begin_date = _parse_date(rc.begin_date)
+        end_date = _parse_date(rc.end_date)
 
         # User specifies person in CL or in config.json
         if not rc.person:
@@ -158,67 +167,64 @@ class PresentationAdderHelper(DbHelperBase):
                     "WARNING: no person been set. please rerun specifying authors,"
                     "or add your id, e.g., sbillinge, to the config.json file in ~/.config/regolith"
                 )
-        split_person = rc.person.strip().split()
-        if len(split_person) >= 2:
-            name_key = split_person[0][0].casefold() + split_person[-1][0].casefold()
-        else:
-            name_key = split_person[0][:2].casefold()
+        name_key = _name_key(rc.person)
 
+        place, name, ptype = rc.place, rc.name, rc.type
         if not rc.id:
-            key = f"{str(begin_date.year)[2:]}{str(begin_date.strftime('%m'))}{name_key}_{''.join(rc.place.casefold().split()).strip()}"
+            place_key = ''.join(place.casefold().split())
+            key = f"{begin_date.year % 100:02d}{begin_date.month:02d}{name_key}_{place_key}"
         else:
             key = rc.id
 
-        coll = self.gtx[rc.coll]
-        pdocl = list(filter(lambda doc: doc["_id"] == key, coll))
-        if len(pdocl) > 0:
+        # the chained db merges the collection across all databases
+        if key in rc.client.chained_db.get(rc.coll, {}):
             raise RuntimeError(
                 "This entry appears to already exist in the collection")
-        else:
-            pdoc = {}
 
-
-        if not rc.authors:
-            authors = [rc.person]
+        authors = rc.authors if rc.authors else [rc.person]
+        if ptype in ['seminar', 'colloquium']:
+            venue = {"institution": place, "department": name}
         else:
-            authors = rc.authors
-
-        pdoc.update({'_id': key,
-                     'abstract': rc.abstract,
-                     'authors': authors,
-                     'begin_date': begin_date,
-                     'end_date': end_date,
-                     })
+            venue = {"location": place, "meeting_name": name}
+        pdoc = {'_id': key,
+                'abstract': rc.abstract,
+                'authors': authors,
+                'begin_date': begin_date,
+                'end_date': end_date,
+                'project': ['all'],
+                'status': rc.status,
+                'title': rc.title,
+                'type': ptype,
+                **venue,
+                }
         if rc.notes:
-            pdoc.update({"notes": rc.notes})
+            pdoc["notes"] = rc.notes
         if rc.presentation_url:
-            pdoc.update({"presentation_url": rc.presentation_url})
+            pdoc["presentation_url"] = rc.presentation_url
         if rc.webinar:
             rc.no_expense = True
-            pdoc.update({"webinar": True})
-        if rc.type in ['seminar', 'colloquium']:
-            pdoc.update({"institution": rc.place,
-                        "department": rc.name})
-        else:
-            pdoc.update({"location": rc.place,
-                        "meeting_name": rc.name})
-        pdoc.update({"project": ['all'],
-                     "status": rc.status,
-                     "title": rc.title,
-                     "type": rc.type,
-                     })
-
-        rc.client.insert_one(rc.database, rc.coll, pdoc)
-        print(f"{key} has been added in {TARGET_COLL}")
+            pdoc["webinar"] = True
 
+        new_docs = {rc.coll: pdoc}
         if not rc.no_expense:
             rc.business = False
             rc.payee = authors[0]
-            rc.purpose = f"give {rc.type} presentation at {rc.name}, {rc.place}"
+            rc.purpose = f"give {ptype} presentation at {name}, {place}"
             rc.where = "tbd"
             rc.status = "unsubmitted"
-            edoc = expense_constructor(key, begin_date, end_date, rc)
-            rc.client.insert_one(rc.database, EXPENSES_COLL, edoc)
-            print(f"{key} has been added in {EXPENSES_COLL}")
+            new_docs[EXPENSES_COLL] = expense_constructor(key, begin_date, end_date, rc)
+
+        if not rc.no_cal:
+            event = {
+                        'summary': name,
+                        'location': place,
+                        'start': {'date': rc.begin_date},
+                        'end': {'date': rc.end_date}
+                    }
+            # before any insert, so a calendar failure leaves the db untouched
+            _add_event_to_calendar(event)
 
+        for coll, doc in new_docs.items():
+            rc.client.insert_one(rc.database, coll, doc)
+        print("\n".join(f"{key} has been added in {coll}" for coll in new_docs))
         return
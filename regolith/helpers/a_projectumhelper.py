@@ -7,19 +7,18 @@ import datetime as dt
 import dateutil.parser as date_parser
 from dateutil.relativedelta import relativedelta
 
-from regolith.helpers.basehelper import DbHelperBase
+from regolith.helpers.basehelper import DbHelperBase, _is_gooey
 from regolith.fsclient import _id_key
 from regolith.tools import (
     all_docs_from_collection,
     get_pi_id,
 )
-from gooey import GooeyParser
 
 TARGET_COLL = "projecta"
 
 def subparser(subpi):
     date_kwargs = {}
-    if isinstance(subpi, GooeyParser):
+    if _is_gooey(subpi):
         date_kwargs['widget'] = 'DateChooser'
 
     subpi.add_argument("name", help="A short but unique name for the projectum",
@@ -5,13 +5,12 @@ import dateutil.parser as date_parser
 from dateutil.relativedelta import relativedelta
 from math import floor
 
-from regolith.helpers.basehelper import DbHelperBase
+from regolith.helpers.basehelper import DbHelperBase, _is_gooey
 from regolith.fsclient import _id_key
 from regolith.tools import (
     all_docs_from_collection,
     get_pi_id,
 )
-from gooey import GooeyParser
 
 TARGET_COLL = "proposals"
 
@@ -22,7 +21,7 @@ def subparser(subpi):
     date_kwargs = {}
     dropdown_kwargs = {}
     int_kwargs = {}
-    if isinstance(subpi, GooeyParser):
+    if _is_gooey(subpi):
         amount_kwargs['widget'] = 'DecimalField'
         amount_kwargs['gooey_options'] = {'min': 0.00, 'max': 1000000.00, 'increment': 10.00, 'precision' : 2}
         notes_kwargs['widget'] = 'Textarea'
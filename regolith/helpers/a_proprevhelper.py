@@ -4,13 +4,12 @@ import sys
 
 import nameparser
 
-from regolith.helpers.basehelper import DbHelperBase
+from regolith.helpers.basehelper import DbHelperBase, _is_gooey
 from regolith.dates import month_to_str_int
 from regolith.fsclient import _id_key
 from regolith.tools import (
     all_docs_from_collection,
 )
-from gooey import GooeyParser
 
 ALLOWED_TYPES = ["nsf", "doe", "other"]
 ALLOWED_STATI = ["invited", "accepted", "declined", "downloaded", "inprogress",
@@ -19,7 +18,7 @@ ALLOWED_STATI = ["invited", "accepted", "declined", "downloaded", "inprogress",
 
 def subparser(subpi):
     date_kwargs = {}
-    if isinstance(subpi, GooeyParser):
+    if _is_gooey(subpi):
         date_kwargs['widget'] = 'DateChooser'
 
     subpi.add_argument("name", help="pi first name space last name in quotes",
@@ -5,13 +5,12 @@ import datetime as dt
 import dateutil.parser as date_parser
 from dateutil.relativedelta import relativedelta
 
-from regolith.helpers.basehelper import DbHelperBase
+from regolith.helpers.basehelper import DbHelperBase, _is_gooey
 from regolith.fsclient import _id_key
 from regolith.tools import (
     all_docs_from_collection,
     get_pi_id,
 )
-from gooey import GooeyParser
 
 TARGET_COLL = "todos"
 ALLOWED_IMPORTANCE = [3, 2, 1, 0]
@@ -20,7 +19,7 @@ ALLOWED_IMPORTANCE = [3, 2, 1, 0]
 def subparser(subpi):
     date_kwargs = {}
     int_kwargs = {}
-    if isinstance(subpi, GooeyParser):
+    if _is_gooey(subpi):
         date_kwargs['widget'] = 'DateChooser'
         int_kwargs['widget'] = 'IntegerField'
         int_kwargs['gooey_options'] = {'min': 0, 'max': 10000}
@@ -1,5 +1,6 @@
 """Builder Base Classes"""
 import os
+import sys
 from xonsh.lib import subprocess
 from glob import glob
 from itertools import groupby
@@ -18,6 +19,18 @@ from regolith.tools import (
     latex_safe_url)
 
 
+def _is_gooey(subpi):
+    """Checks whether a parser is a GooeyParser without importing gooey
+
+    gooey pulls in wx, which is slow to import, so it is only loaded by the
+    gui. If it has not been imported, the parser cannot be a GooeyParser.
+    """
+    gooey = sys.modules.get("gooey")
+    if gooey is None:
+        return False
+    return isinstance(subpi, gooey.GooeyParser)
+
+
 class HelperBase(object):
     """Base class for helpers"""
 
@@ -7,7 +7,7 @@ import sys
 import dateutil.parser as date_parser
 import math
 
-from regolith.helpers.basehelper import DbHelperBase
+from regolith.helpers.basehelper import DbHelperBase, _is_gooey
 from regolith.fsclient import _id_key
 from regolith.tools import (
     all_docs_from_collection,
@@ -16,7 +16,6 @@ from regolith.tools import (
     print_task,
     key_value_pair_filter
 )
-from gooey import GooeyParser
 
 TARGET_COLL = "todos"
 ALLOWED_IMPORTANCE = [0, 1, 2]
@@ -25,7 +24,7 @@ ALLOWED_IMPORTANCE = [0, 1, 2]
 def subparser(subpi):
     date_kwargs = {}
     int_kwargs = {}
-    if isinstance(subpi, GooeyParser):
+    if _is_gooey(subpi):
         date_kwargs['widget'] = 'DateChooser'
         int_kwargs['widget'] = 'IntegerField'
 
@@ -1,12 +1,11 @@
 from regolith.dates import get_dates
-from regolith.helpers.basehelper import SoutHelperBase
+from regolith.helpers.basehelper import SoutHelperBase, _is_gooey
 from regolith.fsclient import _id_key
 from regolith.tools import (
     all_docs_from_collection,
     get_pi_id,
     get_person_contact
 )
-from gooey import GooeyParser
 
 TARGET_COLL = "presentations"
 HELPER_TARGET = "l_abstract"
@@ -14,7 +13,7 @@ HELPER_TARGET = "l_abstract"
 
 def subparser(subpi):
     int_kwargs = {}
-    if isinstance(subpi, GooeyParser):
+    if _is_gooey(subpi):
         int_kwargs['widget'] = 'IntegerField'
         int_kwargs['gooey_options'] = {'min': 2000, 'max': 2100}
 
@@ -7,7 +7,7 @@ from regolith.dates import (
     is_current,
     get_dates
 )
-from regolith.helpers.basehelper import SoutHelperBase
+from regolith.helpers.basehelper import SoutHelperBase, _is_gooey
 from regolith.fsclient import _id_key
 from regolith.tools import (
     all_docs_from_collection,
@@ -15,7 +15,6 @@ from regolith.tools import (
     fuzzy_retrieval,
     search_collection,
 )
-from gooey import GooeyParser
 
 TARGET_COLL = "contacts"
 HELPER_TARGET = "l_contacts"
@@ -24,7 +23,7 @@ HELPER_TARGET = "l_contacts"
 def subparser(subpi):
     date_kwargs = {}
     int_kwargs = {}
-    if isinstance(subpi, GooeyParser):
+    if _is_gooey(subpi):
         date_kwargs['widget'] = 'DateChooser'
         int_kwargs['widget'] = 'IntegerField'
     else:
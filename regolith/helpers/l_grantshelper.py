@@ -7,7 +7,7 @@ from dateutil.relativedelta import relativedelta
 import sys
 
 from regolith.dates import get_dates, is_current
-from regolith.helpers.basehelper import SoutHelperBase
+from regolith.helpers.basehelper import SoutHelperBase, _is_gooey
 from regolith.fsclient import _id_key
 from regolith.tools import (
     all_docs_from_collection,
@@ -17,7 +17,6 @@ from regolith.tools import (
     collection_str,
     merge_collections_superior
 )
-from gooey import GooeyParser
 
 TARGET_COLL = "grants"
 HELPER_TARGET = "l_grants"
@@ -26,7 +25,7 @@ BLACKLIST = ["they_pay", "collgf", "physmatch", "ta", "chemmatch",
 
 def subparser(subpi):
     date_kwargs = {}
-    if isinstance(subpi, GooeyParser):
+    if _is_gooey(subpi):
         date_kwargs['widget'] = 'DateChooser'
 
     subpi.add_argument("-c", "--current", action="store_true", help='outputs only the current grants')
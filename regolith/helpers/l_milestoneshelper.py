@@ -5,7 +5,7 @@
 """
 
 from regolith.dates import get_due_date
-from regolith.helpers.basehelper import SoutHelperBase
+from regolith.helpers.basehelper import SoutHelperBase, _is_gooey
 from regolith.fsclient import _id_key
 from regolith.tools import (
     all_docs_from_collection,
@@ -15,7 +15,6 @@ from regolith.tools import (
 )
 from regolith.schemas import PROJECTUM_STATI, PROJECTUM_PAUSED_STATI, \
     PROJECTUM_CANCELLED_STATI, PROJECTUM_FINISHED_STATI, PROJECTUM_ACTIVE_STATI
-from gooey import GooeyParser
 
 TARGET_COLL = "projecta"
 HELPER_TARGET = "l_milestones"
@@ -26,7 +25,7 @@ ROLES = ['pi', 'lead', 'group_members', 'collaborators']
 
 def subparser(subpi):
     listbox_kwargs = {}
-    if isinstance(subpi, GooeyParser):
+    if _is_gooey(subpi):
         listbox_kwargs['widget'] = 'Listbox'
 
     subpi.add_argument('--helper_help', action="store_true",
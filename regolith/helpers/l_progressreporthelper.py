@@ -3,11 +3,10 @@
    Projecta are small bite-sized project quanta that typically will result in
    one manuscript.
 """
-from gooey import GooeyParser
 import datetime
 import dateutil.parser as date_parser
 
-from regolith.helpers.basehelper import SoutHelperBase
+from regolith.helpers.basehelper import SoutHelperBase, _is_gooey
 from regolith.fsclient import _id_key
 from regolith.tools import (
     all_docs_from_collection,
@@ -21,7 +20,7 @@ HELPER_TARGET = "l_progress"
 
 def subparser(subpi):
     listbox_kwargs = {}
-    if isinstance(subpi, GooeyParser):
+    if _is_gooey(subpi):
         listbox_kwargs['widget'] = 'Listbox'
 
     subpi.add_argument("lead",
@@ -6,7 +6,7 @@
 import datetime as dt
 import dateutil.parser as date_parser
 
-from regolith.helpers.basehelper import SoutHelperBase
+from regolith.helpers.basehelper import SoutHelperBase, _is_gooey
 from regolith.fsclient import _id_key
 from regolith.schemas import (PROJECTUM_ACTIVE_STATI, PROJECTUM_PAUSED_STATI,
    PROJECTUM_CANCELLED_STATI, PROJECTUM_FINISHED_STATI)
@@ -16,7 +16,6 @@ from regolith.tools import (
     key_value_pair_filter,
     collection_str
 )
-from gooey import GooeyParser
 
 TARGET_COLL = "projecta"
 HELPER_TARGET = "l_projecta"
@@ -25,7 +24,7 @@ INACTIVE_STATI = PROJECTUM_PAUSED_STATI + PROJECTUM_CANCELLED_STATI
 def subparser(subpi):
     date_kwargs = {}
     int_kwargs = {}
-    if isinstance(subpi, GooeyParser):
+    if _is_gooey(subpi):
         date_kwargs['widget'] = 'DateChooser'
         int_kwargs['widget'] = 'IntegerField'
 
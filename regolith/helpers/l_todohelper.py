@@ -6,7 +6,7 @@ import dateutil.parser as date_parser
 import math
 
 from regolith.dates import get_due_date
-from regolith.helpers.basehelper import SoutHelperBase
+from regolith.helpers.basehelper import SoutHelperBase, _is_gooey
 from regolith.fsclient import _id_key
 from regolith.schemas import (
     TODO_STATI,
@@ -20,7 +20,6 @@ from regolith.tools import (
     key_value_pair_filter
 )
 from nameparser import HumanName
-from gooey import GooeyParser
 
 TARGET_COLL = "todos"
 HELPER_TARGET = "l_todo"
@@ -32,7 +31,7 @@ def subparser(subpi):
     listbox_kwargs = {}
     date_kwargs = {}
     int_kwargs = {}
-    if isinstance(subpi, GooeyParser):
+    if _is_gooey(subpi):
         listbox_kwargs['widget'] = 'Listbox'
         date_kwargs['widget'] = 'DateChooser'
         int_kwargs['widget'] = 'IntegerField'
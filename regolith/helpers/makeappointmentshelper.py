@@ -12,7 +12,7 @@ from dateutil.relativedelta import relativedelta
 from dateutil import parser as date_parser
 from datetime import timedelta, date
 
-from regolith.helpers.basehelper import SoutHelperBase
+from regolith.helpers.basehelper import SoutHelperBase, _is_gooey
 from regolith.schemas import APPOINTMENTS_TYPES
 from regolith.fsclient import _id_key
 from regolith.tools import (
@@ -26,7 +26,6 @@ from regolith.tools import (
 from regolith.dates import (
     get_dates,
 )
-from gooey import GooeyParser
 import matplotlib
 import matplotlib.pyplot as plt
 
@@ -57,7 +56,7 @@ _future_grant = {
 
 def subparser(subpi):
     date_kwargs = {}
-    if isinstance(subpi, GooeyParser):
+    if _is_gooey(subpi):
         date_kwargs['widget'] = 'DateChooser'
     else:
         subpi.add_argument("run",
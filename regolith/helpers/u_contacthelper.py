@@ -6,10 +6,9 @@ from nameparser import HumanName
 import dateutil.parser as date_parser
 import uuid
 
-from regolith.helpers.basehelper import DbHelperBase
+from regolith.helpers.basehelper import DbHelperBase, _is_gooey
 from regolith.fsclient import _id_key
 from regolith.tools import all_docs_from_collection, fragment_retrieval
-from gooey import GooeyParser
 
 
 TARGET_COLL = "contacts"
@@ -17,7 +16,7 @@ TARGET_COLL = "contacts"
 def subparser(subpi):
     date_kwargs = {}
     notes_kwargs = {}
-    if isinstance(subpi, GooeyParser):
+    if _is_gooey(subpi):
         date_kwargs['widget'] = 'DateChooser'
         notes_kwargs['widget'] = 'Textarea'
 
@@ -2,19 +2,18 @@
 """
 from datetime import date
 
-from regolith.helpers.basehelper import DbHelperBase
+from regolith.helpers.basehelper import DbHelperBase, _is_gooey
 from regolith.fsclient import _id_key
 from regolith.tools import all_docs_from_collection, fragment_retrieval
 import datetime as dt
 from dateutil import parser as date_parser
-from gooey import GooeyParser
 
 TARGET_COLL = "projecta"
 
 
 def subparser(subpi):
     date_kwargs = {}
-    if isinstance(subpi, GooeyParser):
+    if _is_gooey(subpi):
         date_kwargs['widget'] = 'DateChooser'
 
     subpi.add_argument("projectum_id",
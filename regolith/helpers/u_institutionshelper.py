@@ -1,18 +1,17 @@
 """
 Helper for updating/adding  to the projecta collection.
 """
-from regolith.helpers.basehelper import DbHelperBase
+from regolith.helpers.basehelper import DbHelperBase, _is_gooey
 from regolith.fsclient import _id_key
 from regolith.tools import all_docs_from_collection, fragment_retrieval
 import uuid
 import datetime as dt
-from gooey import GooeyParser
 
 TARGET_COLL = "institutions"
 
 def subparser(subpi):
     date_kwargs = {}
-    if isinstance(subpi, GooeyParser):
+    if _is_gooey(subpi):
         date_kwargs['widget'] = 'DateChooser'
 
     subpi.add_argument("institution_id",
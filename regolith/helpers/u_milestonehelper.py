@@ -6,9 +6,8 @@ from copy import deepcopy
 from itertools import chain
 import datetime as dt
 import dateutil.parser as date_parser
-from gooey import GooeyParser
 
-from regolith.helpers.basehelper import DbHelperBase
+from regolith.helpers.basehelper import DbHelperBase, _is_gooey
 from regolith.fsclient import _id_key
 from regolith.tools import all_docs_from_collection, fragment_retrieval
 from regolith.dates import get_due_date
@@ -23,7 +22,7 @@ PROJECTUM_STATI = PROJECTUM_STATI
 
 def subparser(subpi):
     date_kwargs = {}
-    if isinstance(subpi, GooeyParser):
+    if _is_gooey(subpi):
         date_kwargs['widget'] = 'DateChooser'
 
     subpi.add_argument("projectum_id", help="The id of the projectum.  If you just "
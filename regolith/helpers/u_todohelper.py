@@ -8,7 +8,7 @@ import dateutil.parser as date_parser
 from dateutil.relativedelta import relativedelta
 import math
 
-from regolith.helpers.basehelper import DbHelperBase
+from regolith.helpers.basehelper import DbHelperBase, _is_gooey
 from regolith.fsclient import _id_key
 from regolith.schemas import (TODO_STATI, PROJECTUM_ACTIVE_STATI)
 from regolith.tools import (
@@ -18,7 +18,6 @@ from regolith.tools import (
     print_task,
     key_value_pair_filter
 )
-from gooey import GooeyParser
 
 TARGET_COLL = "todos"
 ALLOWED_IMPORTANCE = [3, 2, 1, 0]
@@ -29,7 +28,7 @@ def subparser(subpi):
     date_kwargs = {}
     int_kwargs = {}
     listbox_kwargs = {}
-    if isinstance(subpi, GooeyParser):
+    if _is_gooey(subpi):
         deci_kwargs['widget'] = 'DecimalField'
         deci_kwargs['gooey_options'] = {'min': 0.0, 'max': 10000.0, 'increment': 1, 'precision': 1}
         notes_kwargs['widget'] = 'Textarea'
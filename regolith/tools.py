@@ -2047,15 +2047,11 @@ def validate_doc(collection_name, doc, rc):
         error_message += "\n"
     return v[0], error_message
 
-def add_to_google_calendar(event):
-    """Takes a newly created event, and adds it to the user's google calendar
-
-    Parameters:
-        event - a dictionary containing the event details to be added to google calendar
-                https://developers.google.com/calendar/api/v3/reference/events
+def get_google_calendar_service():
+    """Builds a google calendar api service from the user's stored token
 
     Returns:
-        None
+        the calendar service, or None if no valid credentials are available
     """
 
     tokendir = os.path.expanduser("~/.config/regolith/tokens/google_calendar_api")
@@ -2077,11 +2073,30 @@ def add_to_google_calendar(event):
                   'Please grant permission to regolith to access your calendar. '
                   'If this process takes more than 1 minute you will have to rerun '
                   'the helper to complete the addition of the presentation.')
-            return 0
+            return None
         with open(tokenfile, 'w') as token:
             token.write(creds.to_json())
 
-    service = build('calendar', 'v3', credentials=creds)
+    return build('calendar', 'v3', credentials=creds)
+
+
+def add_to_google_calendar(event, service=None):
+    """Takes a newly created event, and adds it to the user's google calendar
+
+    Parameters:
+        event - a dictionary containing the event details to be added to google calendar
+                https://developers.google.com/calendar/api/v3/reference/events
+        service - a calendar service from get_google_calendar_service. Pass
+                  one in to reuse it across calls, otherwise one is built
+
+    Returns:
+        1 if the event was added, 0 if no valid credentials are available
+    """
+
+    if service is None:
+        service = get_google_calendar_service()
+        if service is None:
+            return 0
     event = service.events().insert(calendarId='primary', body=event).execute()
     print('Event created: %s' % (event.get('htmlLink')))
     return 1
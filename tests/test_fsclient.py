@@ -3,7 +3,7 @@ import datetime
 import tempfile
 from pathlib import Path
 
-from regolith.fsclient import date_encoder, dump_json
+from regolith.fsclient import date_encoder, dump_json, FileSystemClient
 
 
 def test_date_encoder():
@@ -24,3 +24,13 @@ def test_dump_json():
     with open(filename, 'r', encoding="utf-8") as f:
         actual = f.read()
     assert actual == json_doc
+
+
+def test_find_one():
+    client = FileSystemClient(None)
+    client.insert_many("test", "people", [{"_id": "first", "name": "me"},
+                                          {"_id": "second", "name": "you"}])
+    assert client.find_one("test", "people", {"_id": "second"}) == {"_id": "second", "name": "you"}
+    assert client.find_one("test", "people", {"_id": "third"}) is None
+    assert client.find_one("test", "people", {"name": "me"}) == {"_id": "first", "name": "me"}
+    assert client.find_one("test", "people", {"_id": "first", "name": "you"}) is None
@@ -1,9 +1,12 @@
+import json
 import os
 from pathlib import Path
 import pytest
 import copy
 
 from regolith.main import main
+from regolith.client_manager import ClientManager
+from regolith.helpers import a_presentationhelper
 
 dash = "-"
 helper_map = [
@@ -839,6 +842,57 @@ def test_helper_python_loose(hm, make_db, capsys):
     assert hm[1] in out
 
 
+@pytest.mark.parametrize("person, expected", [
+    ("ashaaban", "as"),
+    ("Anna Shaaban", "as"),
+    ("Simon J. L. Billinge", "sb"),
+    ("  Anna\tShaaban \n", "as"),
+    ("a\tb", "ab"),
+])
+def test_a_presentation_name_key(person, expected):
+    assert a_presentationhelper._name_key(person) == expected
+
+
+def test_a_presentation_calendar_error(make_db, monkeypatch, capsys):
+    def calendar_down():
+        raise RuntimeError("calendar is down")
+
+    inserted = []
+    monkeypatch.setattr(a_presentationhelper, "get_google_calendar_service",
+                        calendar_down)
+    monkeypatch.setattr(ClientManager, "insert_one",
+                        lambda self, dbname, collname, doc: inserted.append(doc))
+    repo = Path(make_db)
+    os.chdir(repo)
+    with pytest.raises(RuntimeError, match="calendar is down"):
+        main(args=["helper", "a_presentation", "flat earth", "Venus",
+                   "2020-06-26", "2020-06-26", "--person", "ashaaban"])
+    out, err = capsys.readouterr()
+    assert "has been added" not in out
+    assert inserted == []
+    assert "2006as_venus" not in (repo / "db" / "presentations.yaml").read_text()
+
+
+def test_a_presentation_duplicate_in_other_database(make_db, tmp_path):
+    otherdb = tmp_path / "db"
+    otherdb.mkdir()
+    (otherdb / "presentations.yaml").write_text(
+        "2006as_jupiter:\n  title: already here\n", encoding="utf-8")
+    with open(tmp_path / "regolithrc.json", "w") as f:
+        json.dump({"groupname": "ERGS",
+                   "databases": [
+                       {"name": "test", "url": make_db, "public": True,
+                        "path": "db", "local": True, "backend": "filesystem"},
+                       {"name": "other", "url": str(tmp_path), "public": True,
+                        "path": "db", "local": True, "backend": "filesystem"}
+                   ]}, f)
+    os.chdir(tmp_path)
+    with pytest.raises(RuntimeError, match="already exist"):
+        main(args=["helper", "a_presentation", "flat earth", "Jupiter",
+                   "2020-06-26", "2020-06-26", "--person", "ashaaban",
+                   "--no_cal"])
+
+
 def assert_mongo_vs_yaml_outputs(expecteddir, mongo_database):
     from regolith.mongoclient import load_mongo_col
     from regolith.fsclient import load_yaml
@@ -34,7 +34,8 @@ from regolith.tools import (
     get_formatted_crossref_reference,
     compound_dict,
     compound_list, filter_employment_for_advisees,
-    get_tags, dereference_institution
+    get_tags, dereference_institution,
+    add_to_google_calendar
 )
 
 PEOPLE_COLL = [
@@ -2175,4 +2176,24 @@ def test_get_tags_invalid():
         assert e_info == 'ERROR: valid tags are comma or space separated strings of tag names'
 
 
+def test_add_to_google_calendar_with_service(capsys):
+    class FakeService:
+        def __init__(self):
+            self.inserted = []
 
+        def events(self):
+            return self
+
+        def insert(self, calendarId, body):
+            self.inserted.append((calendarId, body))
+            return self
+
+        def execute(self):
+            return {"htmlLink": "https://calendar.google.com/event"}
+
+    service = FakeService()
+    event = {"summary": "flat earth", "location": "Mars"}
+    assert add_to_google_calendar(event, service=service) == 1
+    assert service.inserted == [("primary", event)]
+    out, err = capsys.readouterr()
+    assert out == "Event created: https://calendar.google.com/event\n"